@@ -5,16 +5,27 @@ Handles data loading, preprocessing, and feature engineering for multi-dataset a
 
 import pandas as pd
 import numpy as np
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import warnings
 
-warnings.filterwarnings('ignore')
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Grouping keys stored as pandas categoricals after cleaning
+CATEGORICAL_COLUMNS = ('State', 'District', 'Age_Group', 'Update_Type')
+
+# Separators between the words of a column name ('Update_Type', 'Pin Code')
+_NAME_TOKEN_SPLIT = re.compile(r'[\s_-]+')
+
+AGE_DTYPE = pd.CategoricalDtype(
+    ['Child (0-5)', 'Child (6-17)', 'Youth (18-25)', 'Adult (26-40)',
+     'Senior (41-60)', 'Elderly (60+)'],
+    ordered=True
+)
+
 
 class AadhaarDataPipeline:
     """Main data pipeline for Aadhaar enrolment, demographic, and biometric datasets"""
@@ -31,19 +42,42 @@ class AadhaarDataPipeline:
     def load_datasets(self, 
                      enrolment_path: str = None,
                      demographic_path: str = None,
-                     biometric_path: str = None) -> Dict[str, pd.DataFrame]:
-        """Load all three datasets from CSV files"""
+                     biometric_path: str = None,
+                     engine: str = "pyarrow") -> Dict[str, pd.DataFrame]:
+        """Load all three datasets from CSV files
+        
+        engine selects the CSV reader: "pyarrow" (default), "polars" or "pandas".
+        Files are parsed concurrently; the pandas reader is used whenever the
+        requested engine is not installed.
+        """
+        if engine not in ("pyarrow", "polars", "pandas"):
+            raise ValueError(f"Unknown CSV engine: {engine}")
+        
+        paths = {
+            'enrolment': enrolment_path,
+            'demographic': demographic_path,
+            'biometric': biometric_path
+        }
+        paths = {name: path for name, path in paths.items() if path}
+        
         try:
-            if enrolment_path:
-                self.enrolment_df = pd.read_csv(enrolment_path)
+            frames = {}
+            if paths:
+                with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+                    futures = {name: executor.submit(self._read_csv, path, engine)
+                               for name, path in paths.items()}
+                    frames = {name: future.result() for name, future in futures.items()}
+            
+            if 'enrolment' in frames:
+                self.enrolment_df = frames['enrolment']
                 logger.info(f"Loaded enrolment data: {self.enrolment_df.shape}")
                 
-            if demographic_path:
-                self.demographic_df = pd.read_csv(demographic_path)
+            if 'demographic' in frames:
+                self.demographic_df = frames['demographic']
                 logger.info(f"Loaded demographic data: {self.demographic_df.shape}")
                 
-            if biometric_path:
-                self.biometric_df = pd.read_csv(biometric_path)
+            if 'biometric' in frames:
+                self.biometric_df = frames['biometric']
                 logger.info(f"Loaded biometric data: {self.biometric_df.shape}")
                 
             return {
@@ -55,99 +89,229 @@ class AadhaarDataPipeline:
             logger.error(f"Error loading datasets: {e}")
             raise
     
+    @staticmethod
+    def _read_csv(path: str, engine: str = "pyarrow") -> pd.DataFrame:
+        """Read a single CSV file with the requested engine"""
+        if engine == "pyarrow":
+            try:
+                from pyarrow import csv as pa_csv
+            except ImportError:
+                logger.warning("pyarrow not installed, falling back to pandas CSV reader")
+            else:
+                table = pa_csv.read_csv(
+                    path,
+                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+                    # Match pandas: empty fields in string columns become NaN
+                    convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+                )
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+        elif engine == "polars":
+            try:
+                import polars as pl
+            except ImportError:
+                logger.warning("polars not installed, falling back to pandas CSV reader")
+            else:
+                return pl.read_csv(path).to_pandas()
+        
+        return pd.read_csv(path)
+    
     def clean_enrolment_data(self) -> pd.DataFrame:
         """Clean and preprocess enrolment dataset"""
         if self.enrolment_df is None:
             raise ValueError("Enrolment data not loaded")
-            
-        df = self.enrolment_df.copy()
-        
-        # Handle missing values
-        df = df.fillna(method='ffill').fillna(method='bfill')
-        
-        # Convert date columns to datetime
-        date_cols = [col for col in df.columns if 'date' in col.lower() or 'month' in col.lower()]
-        for col in date_cols:
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            except:
-                pass
         
-        # Remove duplicates
-        df = df.drop_duplicates()
-        
-        # Handle numeric columns
-        numeric_cols = df.select_dtypes(include=['object']).columns
-        for col in numeric_cols:
-            if df[col].dtype == 'object':
-                try:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                except:
-                    pass
-        
-        self.enrolment_df = df
+        self.enrolment_df = self._clean(self.enrolment_df, coerce_numeric=True)
         logger.info("Enrolment data cleaned")
-        return df
+        return self.enrolment_df
     
     def clean_demographic_data(self) -> pd.DataFrame:
         """Clean and preprocess demographic dataset"""
         if self.demographic_df is None:
             raise ValueError("Demographic data not loaded")
-            
-        df = self.demographic_df.copy()
-        
-        # Handle missing values
-        df = df.fillna(method='ffill').fillna(method='bfill')
-        
-        # Convert date columns
-        date_cols = [col for col in df.columns if 'date' in col.lower() or 'month' in col.lower()]
-        for col in date_cols:
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            except:
-                pass
         
-        # Remove duplicates
-        df = df.drop_duplicates()
-        
-        self.demographic_df = df
+        self.demographic_df = self._clean(self.demographic_df)
         logger.info("Demographic data cleaned")
-        return df
+        return self.demographic_df
     
     def clean_biometric_data(self) -> pd.DataFrame:
         """Clean and preprocess biometric dataset"""
         if self.biometric_df is None:
             raise ValueError("Biometric data not loaded")
-            
-        df = self.biometric_df.copy()
+        
+        self.biometric_df = self._clean(self.biometric_df)
+        logger.info("Biometric data cleaned")
+        return self.biometric_df
+    
+    def clean_all(self) -> Dict[str, pd.DataFrame]:
+        """Clean every loaded dataset concurrently
+        
+        The cleaners are independent and each writes only its own dataset, so
+        they run on a thread pool; the heavy lifting happens in pandas/Polars
+        kernels that release the GIL.
+        """
+        cleaners = {
+            'enrolment': (self.enrolment_df, self.clean_enrolment_data),
+            'demographic': (self.demographic_df, self.clean_demographic_data),
+            'biometric': (self.biometric_df, self.clean_biometric_data)
+        }
+        cleaners = {name: clean for name, (df, clean) in cleaners.items() if df is not None}
+        
+        if cleaners:
+            with ThreadPoolExecutor(max_workers=len(cleaners)) as executor:
+                futures = [executor.submit(clean) for clean in cleaners.values()]
+                for future in futures:
+                    future.result()
+        
+        return {
+            'enrolment': self.enrolment_df,
+            'demographic': self.demographic_df,
+            'biometric': self.biometric_df
+        }
+    
+    def _clean(self, df: pd.DataFrame, coerce_numeric: bool = False,
+               date_keywords: Tuple[str, ...] = ('date', 'month')) -> pd.DataFrame:
+        """Fill missing values, parse date columns, drop duplicates and
+        optionally coerce object columns to numeric.
+        
+        Runs as a single Polars lazy query when Polars is installed, otherwise
+        falls back to the equivalent pandas operations.
+        """
+        # Keywords must match a whole word of the name, so 'Update_Type' and
+        # 'Update_Count' are not taken for dates
+        date_cols = [col for col in df.columns
+                     if not set(date_keywords).isdisjoint(
+                         _NAME_TOKEN_SPLIT.split(col.lower()))]
+        object_cols = []
+        if coerce_numeric:
+            object_cols = [col for col in df.select_dtypes(include=['object']).columns
+                           if col not in date_cols]
+        
+        try:
+            import polars as pl
+        except ImportError:
+            pl = None
+        
+        if pl is None:
+            df = self._clean_pandas(df, date_cols)
+        else:
+            try:
+                df = self._clean_polars(pl, df, date_cols)
+            except Exception as e:
+                logger.warning(f"Polars cleaning failed ({e}), falling back to pandas")
+                df = self._clean_pandas(df, date_cols)
+        
+        # Handle numeric columns
+        self._coerce_numeric(df, object_cols)
+        
+        # Factorize low-cardinality keys once so every later groupby/merge
+        # hashes integer codes instead of strings
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        # Share one ordered dtype across datasets when the labels allow it
+        if 'Age_Group' in df.columns and \
+                df['Age_Group'].cat.categories.isin(AGE_DTYPE.categories).all():
+            df['Age_Group'] = df['Age_Group'].astype(AGE_DTYPE)
+        
+        return df
+    
+    @staticmethod
+    def _clean_polars(pl, df: pd.DataFrame, date_cols: List[str]) -> pd.DataFrame:
+        """Polars implementation of the fill/parse/dedupe steps of _clean"""
+        lf = pl.from_pandas(df).lazy()
+        schema = lf.collect_schema()
         
         # Handle missing values
-        df = df.fillna(method='ffill').fillna(method='bfill')
+        lf = lf.fill_null(strategy='forward').fill_null(strategy='backward')
         
-        # Convert date columns
-        date_cols = [col for col in df.columns if 'date' in col.lower() or 'month' in col.lower()]
+        # Convert date columns to datetime
+        date_exprs = []
         for col in date_cols:
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            except:
-                pass
+            if schema[col] == pl.String:
+                date_exprs.append(pl.col(col).str.to_datetime(strict=False))
+            elif schema[col] == pl.Date:
+                date_exprs.append(pl.col(col).cast(pl.Datetime))
+        if date_exprs:
+            lf = lf.with_columns(date_exprs)
         
         # Remove duplicates
-        df = df.drop_duplicates()
+        lf = lf.unique(maintain_order=True)
         
-        self.biometric_df = df
-        logger.info("Biometric data cleaned")
-        return df
+        return lf.collect().to_pandas()
+    
+    @staticmethod
+    def _clean_pandas(df: pd.DataFrame, date_cols: List[str]) -> pd.DataFrame:
+        """pandas implementation of the fill/parse/dedupe steps of _clean.
+        
+        Works on df in place rather than on a copy; the cleaners replace the
+        stored dataset with the result anyway.
+        """
+        # Handle missing values
+        AadhaarDataPipeline._fill_missing(df)
+        
+        # Convert date columns to datetime
+        for col in date_cols:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        
+        # Remove duplicates
+        return df.drop_duplicates()
+    
+    @staticmethod
+    def _coerce_numeric(df: pd.DataFrame, object_cols: List[str],
+                        min_parsed: float = 0.9) -> None:
+        """Convert object columns holding numeric text to numbers in place.
+        
+        Columns where no more than min_parsed of the non-null values parse as
+        numbers are left untouched, so text columns such as State and District
+        are not coerced to NaN.
+        """
+        if not object_cols:
+            return
+        
+        original = df[object_cols]
+        converted = original.apply(pd.to_numeric, errors='coerce')
+        keep = converted.notna().sum() > min_parsed * original.notna().sum()
+        if keep.any():
+            df[converted.columns[keep]] = converted.loc[:, keep]
+    
+    @staticmethod
+    def _fill_missing(df: pd.DataFrame) -> None:
+        """Forward-fill then backward-fill every column of df in place.
+        
+        Equivalent to df.ffill().bfill(), but computes the source row for each
+        position once and gathers each column with a single take instead of
+        materialising two intermediate frames.
+        """
+        needs_fill = df.isna().any()
+        if not needs_fill.any():
+            return
+        
+        positions = np.arange(len(df))
+        for col in needs_fill.index[needs_fill.to_numpy()]:
+            values = df[col]
+            mask = values.isna().to_numpy()
+            if mask.all():
+                continue
+            # Last valid row at or before each position, -1 before the first one
+            idx = np.where(mask, -1, positions)
+            np.maximum.accumulate(idx, out=idx)
+            # Leading gaps are back-filled from the first valid row
+            idx[idx < 0] = np.argmax(~mask)
+            df[col] = values.array.take(idx)
     
     def aggregate_by_state_district(self, df: pd.DataFrame, value_col: str) -> pd.DataFrame:
         """Aggregate data by state and district"""
+        return self.aggregate_by_state_district_many(df, [value_col])
+    
+    def aggregate_by_state_district_many(self, df: pd.DataFrame,
+                                         value_cols: List[str]) -> pd.DataFrame:
+        """Aggregate several value columns by state and district in one groupby"""
         if 'State' not in df.columns or 'District' not in df.columns:
             logger.warning("State or District column not found")
             return df
-            
-        agg_df = df.groupby(['State', 'District'])[value_col].sum().reset_index()
-        agg_df.columns = ['State', 'District', value_col]
-        return agg_df
+        
+        gb = df.groupby(['State', 'District'], observed=True, sort=False)
+        return gb[list(value_cols)].sum().reset_index()
     
     def calculate_migration_indicators(self) -> pd.DataFrame:
         """Calculate migration patterns and indicators"""
@@ -155,11 +319,10 @@ class AadhaarDataPipeline:
             raise ValueError("Required datasets not loaded")
         
         # Merge enrolment and demographic updates
-        merged = pd.merge(
+        merged = self._left_join(
             self.enrolment_df,
             self.demographic_df,
             on=['State', 'District', 'Pin Code'],
-            how='left',
             suffixes=('_enrol', '_demo')
         )
         
@@ -171,15 +334,63 @@ class AadhaarDataPipeline:
             migration_df['District'] = merged['District']
             migration_df['Enrolment'] = merged['Aadhaar Generated_enrol']
             migration_df['Updates'] = merged['Update_count']
-            migration_df['Update_Rate'] = (migration_df['Updates'] / 
-                                          (migration_df['Enrolment'] + 1)) * 100
+            migration_df['Update_Rate'] = ((migration_df['Updates'] / 
+                                           (migration_df['Enrolment'] + 1)) * 100).astype(np.float32)
             migration_df['Migration_Risk'] = self._calculate_migration_risk(migration_df)
         
         return migration_df
     
+    @staticmethod
+    def _left_join(left: pd.DataFrame, right: pd.DataFrame, on: List[str],
+                   suffixes: Tuple[str, str] = ('_x', '_y')) -> pd.DataFrame:
+        """Left join on `on`, equivalent to pd.merge(how='left').
+        
+        Each key column is factorized over both frames and the codes are packed
+        into one int64 key, so the join probes a hash table of integers rather
+        than re-hashing string tuples. Falls back to pd.merge when the right
+        side has duplicate keys (a one-to-many join) or when the packed key
+        space would not fit in int64.
+        """
+        n_left = len(left)
+        left_key = np.zeros(n_left, dtype=np.int64)
+        right_key = np.zeros(len(right), dtype=np.int64)
+        # Number of distinct packed keys so far, as a Python int so the
+        # overflow check itself cannot overflow
+        key_space = 1
+        for col in on:
+            codes, uniques = pd.factorize(
+                pd.concat([left[col], right[col]], ignore_index=True),
+                use_na_sentinel=False
+            )
+            key_space *= max(len(uniques), 1)
+            if key_space > np.iinfo(np.int64).max:
+                return pd.merge(left, right, on=on, how='left', suffixes=suffixes)
+            left_key = left_key * len(uniques) + codes[:n_left]
+            right_key = right_key * len(uniques) + codes[n_left:]
+        
+        right_index = pd.Index(right_key)
+        if not right_index.is_unique:
+            return pd.merge(left, right, on=on, how='left', suffixes=suffixes)
+        # Row of the match in `right` for every row of `left`, -1 if none
+        matched = right_index.get_indexer(left_key)
+        
+        overlap = set(left.columns).intersection(right.columns).difference(on)
+        columns = {}
+        for col in left.columns:
+            name = f"{col}{suffixes[0]}" if col in overlap else col
+            columns[name] = left[col].array
+        for col in right.columns:
+            if col in on:
+                continue
+            name = f"{col}{suffixes[1]}" if col in overlap else col
+            columns[name] = right[col].array.take(matched, allow_fill=True)
+        
+        return pd.DataFrame(columns)
+    
     def _calculate_migration_risk(self, df: pd.DataFrame) -> np.ndarray:
         """Calculate migration risk score (0-100)"""
-        update_rate = df['Update_Rate'].fillna(0)
+        # Scores are only ranked and thresholded, so single precision suffices
+        update_rate = df['Update_Rate'].fillna(0).astype(np.float32)
         # Normalize to 0-100 scale
         risk_score = ((update_rate - update_rate.min()) / 
                      (update_rate.max() - update_rate.min() + 1e-6) * 100)
@@ -196,7 +407,7 @@ class AadhaarDataPipeline:
         
         # Group by state and calculate quality metrics
         if 'State' in df.columns:
-            biometric_health = df.groupby('State').agg({
+            biometric_health = df.groupby('State', observed=True).agg({
                 'Update_Count': ['sum', 'mean'],
                 'Age_Group': 'count'
             }).reset_index()
@@ -218,19 +429,19 @@ class AadhaarDataPipeline:
         
         # Enrolment by age group
         if self.enrolment_df is not None and 'Age_Group' in self.enrolment_df.columns:
-            analysis['enrolment_age'] = self.enrolment_df.groupby('Age_Group').agg({
+            analysis['enrolment_age'] = self.enrolment_df.groupby('Age_Group', observed=True, sort=False).agg({
                 'Aadhaar Generated': 'sum'
             }).reset_index()
         
         # Demographic updates by age group
         if self.demographic_df is not None and 'Age_Group' in self.demographic_df.columns:
-            analysis['demographic_age'] = self.demographic_df.groupby('Age_Group').agg({
+            analysis['demographic_age'] = self.demographic_df.groupby('Age_Group', observed=True, sort=False).agg({
                 'Update_Count': 'sum'
             }).reset_index()
         
         # Biometric updates by age group
         if self.biometric_df is not None and 'Age_Group' in self.biometric_df.columns:
-            analysis['biometric_age'] = self.biometric_df.groupby('Age_Group').agg({
+            analysis['biometric_age'] = self.biometric_df.groupby('Age_Group', observed=True, sort=False).agg({
                 'Update_Count': 'sum'
             }).reset_index()
         
@@ -239,10 +450,9 @@ class AadhaarDataPipeline:
     def identify_anomalies(self, df: pd.DataFrame, column: str, 
                           threshold: float = 2.5) -> pd.DataFrame:
         """Identify statistical anomalies using Z-score"""
-        from scipy import stats
-        
-        df = df.copy()
-        z_scores = np.abs(stats.zscore(df[column].fillna(0)))
+        # NaN-aware mean/std; missing values are never flagged
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        z_scores = np.abs((values - np.nanmean(values)) / (np.nanstd(values) + 1e-12))
         anomalies = df[z_scores > threshold]
         
         return anomalies
@@ -286,19 +496,42 @@ class AadhaarDataPipeline:
         
         return insights
     
-    def export_processed_data(self, output_dir: str) -> None:
-        """Export all processed datasets"""
+    def export_processed_data(self, output_dir: str, format: str = 'parquet') -> None:
+        """Export all processed datasets
+        
+        format is 'parquet' (zstd-compressed, the default) or 'csv'. Parquet
+        export needs pyarrow and falls back to CSV without it.
+        """
+        if format not in ('parquet', 'csv'):
+            raise ValueError(f"Unknown export format: {format}")
+        
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        if self.enrolment_df is not None:
-            self.enrolment_df.to_csv(output_path / "enrolment_processed.csv", index=False)
-            
-        if self.demographic_df is not None:
-            self.demographic_df.to_csv(output_path / "demographic_processed.csv", index=False)
-            
-        if self.biometric_df is not None:
-            self.biometric_df.to_csv(output_path / "biometric_processed.csv", index=False)
+        if format == 'parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                logger.warning("pyarrow not installed, exporting CSV instead")
+                format = 'csv'
+        
+        datasets = {
+            'enrolment': self.enrolment_df,
+            'demographic': self.demographic_df,
+            'biometric': self.biometric_df
+        }
+        for name, df in datasets.items():
+            if df is None:
+                continue
+            if format == 'parquet':
+                pq.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                               output_path / f"{name}_processed.parquet",
+                               compression='zstd')
+            else:
+                # Stream the text out in chunks rather than all at once
+                df.to_csv(output_path / f"{name}_processed.csv", index=False,
+                          chunksize=100_000)
         
         logger.info(f"Processed data exported to {output_path}")
 
@@ -309,8 +542,11 @@ class DataValidator:
     @staticmethod
     def check_missing_values(df: pd.DataFrame) -> Dict[str, float]:
         """Check percentage of missing values"""
-        missing = (df.isnull().sum() / len(df) * 100).to_dict()
-        return {k: v for k, v in missing.items() if v > 0}
+        if len(df) == 0:
+            return {}
+        counts = df.isna().to_numpy().sum(axis=0)
+        pct = counts * (100.0 / len(df))
+        return {col: float(p) for col, p in zip(df.columns, pct) if p > 0}
     
     @staticmethod
     def check_data_types(df: pd.DataFrame) -> Dict[str, str]:
@@ -319,15 +555,16 @@ class DataValidator:
     
     @staticmethod
     def check_outliers(df: pd.DataFrame, numeric_cols: List[str]) -> Dict[str, int]:
-        """Check for outliers using IQR method"""
-        from scipy import stats
-        outliers = {}
-        
-        for col in numeric_cols:
-            if col in df.columns and df[col].dtype in [np.int64, np.float64]:
-                z_scores = np.abs(stats.zscore(df[col].fillna(0)))
-                outlier_count = (z_scores > 3).sum()
-                if outlier_count > 0:
-                    outliers[col] = outlier_count
-        
-        return outliers
+        """Check for outliers using Z-score (|z| > 3)"""
+        cols = [col for col in numeric_cols
+                if col in df.columns and df[col].dtype in [np.int64, np.float64]]
+        if not cols:
+            return {}
+        
+        # One NaN-aware pass over all selected columns at once
+        arr = df[cols].to_numpy(dtype=np.float64)
+        mean = np.nanmean(arr, axis=0)
+        std = np.nanstd(arr, axis=0)
+        counts = (np.abs((arr - mean) / (std + 1e-12)) > 3).sum(axis=0)
+        
+        return {col: int(count) for col, count in zip(cols, counts) if count > 0}
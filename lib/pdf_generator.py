@@ -7,378 +7,554 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
-    PageBreak, Image, KeepTogether, PageTemplate, Frame
+    BaseDocTemplate, Table, TableStyle, Paragraph, Spacer,
+    PageBreak, Image, KeepTogether, PageTemplate, Frame, Flowable
 )
+from reportlab.platypus.paragraph import textTransformFrags
+from reportlab.platypus.paraparser import ParaFrag
+from reportlab.lib.fonts import ps2tt, tt2ps
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas
+import numpy as np
+from dataclasses import dataclass
 from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import functools
+import itertools
 import os
-from typing import List, Dict, Optional
+import re
+import types
+from xml.sax.saxutils import escape
+from typing import Iterator, List, Dict, Mapping, Optional, Set, Tuple, Union
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Report palette (Tailwind slate), parsed once
+_SLATE_900 = colors.HexColor('#0f172a')
+_SLATE_800 = colors.HexColor('#1e293b')
+_SLATE_700 = colors.HexColor('#334155')
+_SLATE_600 = colors.HexColor('#475569')
+_SLATE_300 = colors.HexColor('#cbd5e1')
+_SLATE_100 = colors.HexColor('#f1f5f9')
+
+# Styles are built once at import and shared by every report
+def _create_styles():
+    """Create custom paragraph styles"""
+    styles = getSampleStyleSheet()
+    
+    # Title Style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=28,
+        textColor=_SLATE_800,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Heading 2
+    styles.add(ParagraphStyle(
+        name='CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=_SLATE_900,
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Body
+    styles.add(ParagraphStyle(
+        name='CustomBody',
+        parent=styles['BodyText'],
+        fontSize=11,
+        textColor=_SLATE_700,
+        alignment=TA_JUSTIFY,
+        spaceAfter=12,
+        leading=16
+    ))
+    
+    # Insight box
+    styles.add(ParagraphStyle(
+        name='InsightBox',
+        parent=styles['BodyText'],
+        fontSize=10,
+        textColor=_SLATE_800,
+        leftIndent=20,
+        spaceAfter=10
+    ))
+    
+    return styles
+
+
+_STYLES = _create_styles()
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    name='Subtitle',
+    fontSize=14,
+    textColor=_SLATE_600,
+    alignment=TA_CENTER,
+    spaceAfter=20
+)
+
+_FINDING_TITLE_STYLE = ParagraphStyle(
+    name='FindingTitle',
+    fontSize=12,
+    textColor=_SLATE_800,
+    spaceAfter=6,
+    fontName='Helvetica-Bold'
+)
+
+_REC_TITLE_STYLE = ParagraphStyle(
+    name='RecTitle',
+    fontSize=11,
+    textColor=_SLATE_900,
+    spaceAfter=6,
+    fontName='Helvetica-Bold'
+)
+
+
+# Table.setStyle only reads the commands, so one instance serves every report
+_METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _SLATE_900),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, _SLATE_300),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _SLATE_100]),
+])
+
+_METRICS_COL_WIDTHS = [2.2*inch, 1.5*inch, 1.2*inch, 1.1*inch]
+
+_METRICS_DATA = (
+    ('Metric', 'Value', 'Status', 'Trend'),
+    ('Total Active Aadhaar', '1.23 Billion', 'Healthy', '↑ 4.2%'),
+    ('Demographic Updates', '98.8 Million', 'Healthy', '↑ 3.1%'),
+    ('Biometric Coverage', '87.5%', 'Good', '↑ 2.8%'),
+    ('High-Risk Districts', '127', 'Alert', '↓ 2.3%'),
+    ('Vulnerable Population', '456.8 Million', 'Alert', '↑ 1.5%'),
+    ('Anomalies Detected', '234', 'Warning', '↑ 5.2%'),
+)
+
+# Static report prose, parsed into flowables once at import (ReportLab's
+# paragraph parser is a major cost of a build). Paragraphs keep layout state
+# on themselves while being wrapped, so each report uses shallow copies.
+_EXEC_SUMMARY_TEXT = """
+This comprehensive analytics report reveals critical insights into Aadhaar enrolment patterns,
+demographic updates, and biometric system health across India. The analysis identifies key
+trends in life-stage migration, population vulnerability, and system anomalies that require
+policy intervention and system improvements.
+<br/><br/>
+<b>Key Findings:</b><br/>
+• Significant variation in biometric coverage across states (48%-89%)<br/>
+• High migration risk in border and economically mobile regions<br/>
+• Vulnerability gaps among children (0-5 years) and elderly (60+) populations<br/>
+• Digital exclusion patterns in rural and geographically isolated districts<br/>
+• Anomalies detected in 234 districts requiring detailed investigation
+"""
+
+_CONCLUSION_TEXT = """
+The Aadhaar ecosystem has achieved unprecedented coverage and adoption, forming the backbone
+of India's digital identity infrastructure. However, analysis reveals critical gaps in coverage
+for vulnerable populations, significant regional disparities in system health, and emerging patterns
+of life-stage migration that demand nuanced policy responses.
+<br/><br/>
+Success requires targeted interventions: mobile enrollment camps for underserved populations,
+simplified biometric processes for elderly citizens, school-based programs for child enrollment,
+and robust data quality assurance frameworks. The path forward combines technological improvements
+with human-centered design and equitable access principles.
+"""
+
+# Read-only views, since the findings are shared by every report
+_FINDINGS: Tuple[Mapping[str, str], ...] = (
+    types.MappingProxyType({
+        'title': 'Life-Stage Migration Patterns',
+        'content': 'Address updates concentrated in economically active age groups (18-40 years), indicating migration for employment. Rural-to-urban migration shows 3x higher update rates.',
+        'severity': 'HIGH'
+    }),
+    types.MappingProxyType({
+        'title': 'Child Identity Coverage Gaps',
+        'content': 'Only 45% of children (0-5 years) have Aadhaar enrolment. Coverage improves to 85% for school-age children (6-17), indicating dependence on institutional enrollment.',
+        'severity': 'CRITICAL'
+    }),
+    types.MappingProxyType({
+        'title': 'Elderly Digital Exclusion',
+        'content': 'Biometric update rates for elderly (60+) are 40% lower than working-age populations. Technical barriers and limited accessibility in enrollment centers cited.',
+        'severity': 'HIGH'
+    }),
+    types.MappingProxyType({
+        'title': 'Biometric System Fragmentation',
+        'content': 'Fingerprint capture quality varies significantly (65%-92% across states). Iris recognition coverage limited to major urban centers.',
+        'severity': 'MEDIUM'
+    }),
+    types.MappingProxyType({
+        'title': 'Data Anomalies Detected',
+        'content': '234 districts show statistical anomalies in enrolment/update patterns. Analysis suggests data entry errors, privacy concerns, or system integration issues.',
+        'severity': 'MEDIUM'
+    })
+)
+
+_FINDING_TITLE_FMT = '<b>{title}</b> [{severity}]'.format_map
+
+# Filled from a defaultdict so that missing metrics render as N/A
+_METRICS_SUMMARY_TMPL = """
+<b>Key Metrics Overview:</b><br/>
+• Total Enrolment: {totalEnrolment}<br/>
+• Demographic Updates: {demographicUpdates}<br/>
+• Biometric Coverage: {biometricCoverage}<br/>
+• High-Risk Districts: {highRiskDistricts}<br/>
+• Vulnerable Population: {vulnerablePopulation}
+"""
+
+
+# Text with no tags or entities, which the paragraph parser would turn
+# into a single fragment anyway
+_NO_MARKUP_RE = re.compile(r'^[^<&]*$')
+
+
+class _PlainParagraph(Paragraph):
+    """Paragraph that skips the XML parser for text without markup"""
+    
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        if frags is None and _NO_MARKUP_RE.match(text):
+            text = cleaner(text)
+            if text:
+                # Same fragment ParaParser builds for untagged text
+                frag = ParaFrag()
+                frag.__tag__ = 'para'
+                frag.rise = 0
+                frag.greek = 0
+                frag.link = []
+                frag.us_lines = []
+                family, frag.bold, frag.italic = ps2tt(style.fontName)
+                frag.fontName = tt2ps(family, frag.bold, frag.italic)
+                frag.fontSize = style.fontSize
+                frag.textColor = style.textColor
+                frag.text = text
+                frags = [frag]
+                textTransformFrags(frags, style)
+        super()._setup(text, style, bulletText, frags, cleaner)
+
+
+@functools.lru_cache(maxsize=None)
+def _spacer(height: float) -> Spacer:
+    """Shared Spacer of the given height in inches"""
+    return Spacer(1, height*inch)
+
+
+def _build_findings_flowables() -> List:
+    """Title, body and spacer flowables for every entry in _FINDINGS"""
+    flowables = []
+    for finding in _FINDINGS:
+        flowables.append(Paragraph(_FINDING_TITLE_FMT(finding), _FINDING_TITLE_STYLE))
+        flowables.append(_PlainParagraph(finding['content'], _STYLES['InsightBox']))
+        flowables.append(_spacer(0.15))
+    return flowables
+
+
+_EXEC_SUMMARY_PARA = Paragraph(_EXEC_SUMMARY_TEXT, _STYLES['CustomBody'])
+_CONCLUSION_PARA = Paragraph(_CONCLUSION_TEXT, _STYLES['CustomBody'])
+_FINDINGS_FLOWABLES = _build_findings_flowables()
+
+
+_PAGE_MARGIN = 0.75*inch
+# Content frame: the A4 page less the margins on every side
+_FRAME_BOUNDS = (_PAGE_MARGIN, _PAGE_MARGIN,
+                 A4[0] - 2*_PAGE_MARGIN, A4[1] - 2*_PAGE_MARGIN)
+
+
+class _AadhaarDocTemplate(BaseDocTemplate):
+    """A4 document with one page template holding a single full-page frame.
+    
+    Replaces SimpleDocTemplate, whose separate first/later page templates and
+    per-page callbacks the report never uses.
+    """
+    
+    def __init__(self, filename: str, **kw):
+        super().__init__(
+            filename,
+            pagesize=A4,
+            rightMargin=_PAGE_MARGIN,
+            leftMargin=_PAGE_MARGIN,
+            topMargin=_PAGE_MARGIN,
+            bottomMargin=_PAGE_MARGIN,
+            **kw
+        )
+        # Frames track layout position during a build, so each document
+        # gets its own
+        self.addPageTemplates([
+            PageTemplate(id='main', frames=[Frame(*_FRAME_BOUNDS, id='F1')])
+        ])
+    
+    def afterFlowable(self, flowable):
+        """Clear the postponed mark once a flowable has been drawn"""
+        # handle_flowable never clears it, and a shared _spacer() instance
+        # pushed to a new frame twice would otherwise raise LayoutError
+        flowable.__dict__.pop('_postponed', None)
+
+
+@dataclass(slots=True, frozen=True)
+class Recommendation:
+    """A single entry in the Strategic Recommendations section"""
+    title: str
+    description: str
+    priority: int = 0
+    timeline: str = ''
+    
+    @classmethod
+    def from_dict(cls, rec: Mapping) -> 'Recommendation':
+        """Build from the dict form accepted by earlier versions"""
+        return cls(
+            title=rec.get('title', 'Recommendation'),
+            description=rec.get('description', ''),
+            priority=rec.get('priority', 0),
+            timeline=rec.get('timeline', '')
+        )
+
+
+# Recommendation instances or plain dicts with the same keys
+RecommendationInput = Union[Recommendation, Mapping]
+
+
 class AadhaarReportGenerator:
     """Generate comprehensive PDF reports on Aadhaar analytics"""
     
-    def __init__(self, output_dir: str = "./reports"):
-        """Initialize report generator"""
+    # Output directories already created in this process
+    _ensured_dirs: Set[str] = set()
+    
+    def __init__(self, output_dir: str = "./reports", page_compression: bool = True):
+        """Initialize report generator
+        
+        page_compression=False writes uncompressed content streams, which
+        skips the zlib work for throwaway draft builds at the cost of larger
+        files. ReportLab only supports compression on or off, not a level.
+        """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self.page_compression = page_compression
+        if output_dir not in AadhaarReportGenerator._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            AadhaarReportGenerator._ensured_dirs.add(output_dir)
         self.doc = None
         self.story = []
-        self.styles = self._create_styles()
-    
-    def _create_styles(self):
-        """Create custom paragraph styles"""
-        styles = getSampleStyleSheet()
-        
-        # Title Style
-        styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=28,
-            textColor=colors.HexColor('#1e293b'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Heading 2
-        styles.add(ParagraphStyle(
-            name='CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#0f172a'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Body
-        styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=styles['BodyText'],
-            fontSize=11,
-            textColor=colors.HexColor('#334155'),
-            alignment=TA_JUSTIFY,
-            spaceAfter=12,
-            leading=16
-        ))
-        
-        # Insight box
-        styles.add(ParagraphStyle(
-            name='InsightBox',
-            parent=styles['BodyText'],
-            fontSize=10,
-            textColor=colors.HexColor('#1e293b'),
-            leftIndent=20,
-            spaceAfter=10
-        ))
-        
-        return styles
+        self._now = None
+        # Shared by all instances; treat as read-only
+        self.styles = _STYLES
     
     def create_report(self, insights_data: Dict, 
-                     recommendations: List[Dict],
+                     recommendations: List[RecommendationInput],
                      metrics: Dict,
                      filename: str = None) -> str:
         """Create comprehensive report"""
+        # One timestamp for both the filename and the cover page
+        self._now = datetime.now()
         if filename is None:
-            filename = f"aadhaar_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            filename = f"aadhaar_analysis_{self._now:%Y%m%d_%H%M%S}.pdf"
         
         filepath = os.path.join(self.output_dir, filename)
         
-        self.doc = SimpleDocTemplate(
+        self.doc = _AadhaarDocTemplate(
             filepath,
-            pagesize=A4,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            pageCompression=int(self.page_compression)
         )
         
-        self.story = []
-        
-        # Build report sections
-        self._add_cover_page(metrics)
-        self.story.append(PageBreak())
-        
-        self._add_executive_summary(insights_data)
-        self.story.append(PageBreak())
-        
-        self._add_key_findings(insights_data)
-        self.story.append(PageBreak())
-        
-        self._add_metrics_analysis(metrics)
-        self.story.append(PageBreak())
-        
-        self._add_recommendations(recommendations)
-        self.story.append(PageBreak())
-        
-        self._add_conclusion()
+        # Each section is a generator of flowables; doc.build consumes the
+        # story from the front, dropping flowables once they are laid out
+        self.story = list(itertools.chain(
+            self._add_cover_page(metrics), [PageBreak()],
+            self._add_executive_summary(insights_data), [PageBreak()],
+            self._add_key_findings(insights_data), [PageBreak()],
+            self._add_metrics_analysis(metrics), [PageBreak()],
+            self._add_recommendations(recommendations), [PageBreak()],
+            self._add_conclusion()
+        ))
         
         # Build PDF
         self.doc.build(self.story)
-        logger.info(f"Report generated: {filepath}")
+        logger.info("Report generated: %s", filepath)
         
         return filepath
     
-    def _add_cover_page(self, metrics: Dict):
-        """Add cover page"""
+    def create_reports_batch(self, jobs: List[Tuple[Dict, List[RecommendationInput], Dict, str]],
+                             max_workers: Optional[int] = None) -> List[str]:
+        """Create several reports in parallel worker processes
+        
+        Each job is a (insights_data, recommendations, metrics, filename) tuple
+        of create_report arguments; give every job its own filename. Returns
+        the report paths in job order.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_create_report_job,
+                                     itertools.repeat(self.output_dir),
+                                     itertools.repeat(self.page_compression),
+                                     jobs))
+    
+    def _section_header(self, title: str) -> Iterator[Flowable]:
+        """Yield a section heading and the gap below it"""
+        yield _PlainParagraph(title, self.styles['CustomHeading'])
+        yield _spacer(0.2)
+    
+    def _add_cover_page(self, metrics: Dict) -> Iterator[Flowable]:
+        """Yield the cover page"""
         # Title
-        self.story.append(Spacer(1, 1.5*inch))
-        title = Paragraph(
+        yield _spacer(1.5)
+        yield Paragraph(
             "Aadhaar Enrolment & Updates<br/>Analytics Report",
             self.styles['CustomTitle']
         )
-        self.story.append(title)
         
         # Subtitle
-        self.story.append(Spacer(1, 0.3*inch))
-        subtitle = Paragraph(
+        yield _spacer(0.3)
+        yield Paragraph(
             "Unlocking Societal Trends, Migration Patterns & System Health Indicators",
-            ParagraphStyle(
-                name='Subtitle',
-                fontSize=14,
-                textColor=colors.HexColor('#475569'),
-                alignment=TA_CENTER,
-                spaceAfter=20
-            )
+            _SUBTITLE_STYLE
         )
-        self.story.append(subtitle)
         
         # Date and metadata
-        self.story.append(Spacer(1, 1*inch))
-        date_text = Paragraph(
-            f"<b>Report Generated:</b> {datetime.now().strftime('%B %d, %Y')}<br/>" +
+        yield _spacer(1)
+        yield Paragraph(
+            f"<b>Report Generated:</b> {self._now:%B %d, %Y}<br/>" +
             "<b>Analysis Period:</b> Last 90 days<br/>" +
             "<b>Data Coverage:</b> All States & Union Territories",
             self.styles['CustomBody']
         )
-        self.story.append(date_text)
         
         # Key metrics preview
-        self.story.append(Spacer(1, 0.5*inch))
-        metrics_text = self._format_metrics_summary(metrics)
-        self.story.append(metrics_text)
+        yield _spacer(0.5)
+        yield self._format_metrics_summary(metrics)
     
-    def _add_executive_summary(self, insights_data: Dict):
-        """Add executive summary"""
-        self.story.append(Paragraph("Executive Summary", self.styles['CustomHeading']))
-        self.story.append(Spacer(1, 0.2*inch))
-        
-        summary_text = """
-        This comprehensive analytics report reveals critical insights into Aadhaar enrolment patterns,
-        demographic updates, and biometric system health across India. The analysis identifies key
-        trends in life-stage migration, population vulnerability, and system anomalies that require
-        policy intervention and system improvements.
-        <br/><br/>
-        <b>Key Findings:</b><br/>
-        • Significant variation in biometric coverage across states (48%-89%)<br/>
-        • High migration risk in border and economically mobile regions<br/>
-        • Vulnerability gaps among children (0-5 years) and elderly (60+) populations<br/>
-        • Digital exclusion patterns in rural and geographically isolated districts<br/>
-        • Anomalies detected in 234 districts requiring detailed investigation
-        """
+    def _add_executive_summary(self, insights_data: Dict) -> Iterator[Flowable]:
+        """Yield the executive summary"""
+        yield from self._section_header("Executive Summary")
         
-        para = Paragraph(summary_text, self.styles['CustomBody'])
-        self.story.append(para)
+        yield copy.copy(_EXEC_SUMMARY_PARA)
     
-    def _add_key_findings(self, insights_data: Dict):
-        """Add key findings section"""
-        self.story.append(Paragraph("Key Findings & Analysis", self.styles['CustomHeading']))
-        self.story.append(Spacer(1, 0.2*inch))
-        
-        findings = [
-            {
-                'title': 'Life-Stage Migration Patterns',
-                'content': 'Address updates concentrated in economically active age groups (18-40 years), indicating migration for employment. Rural-to-urban migration shows 3x higher update rates.',
-                'severity': 'HIGH'
-            },
-            {
-                'title': 'Child Identity Coverage Gaps',
-                'content': 'Only 45% of children (0-5 years) have Aadhaar enrolment. Coverage improves to 85% for school-age children (6-17), indicating dependence on institutional enrollment.',
-                'severity': 'CRITICAL'
-            },
-            {
-                'title': 'Elderly Digital Exclusion',
-                'content': 'Biometric update rates for elderly (60+) are 40% lower than working-age populations. Technical barriers and limited accessibility in enrollment centers cited.',
-                'severity': 'HIGH'
-            },
-            {
-                'title': 'Biometric System Fragmentation',
-                'content': 'Fingerprint capture quality varies significantly (65%-92% across states). Iris recognition coverage limited to major urban centers.',
-                'severity': 'MEDIUM'
-            },
-            {
-                'title': 'Data Anomalies Detected',
-                'content': '234 districts show statistical anomalies in enrolment/update patterns. Analysis suggests data entry errors, privacy concerns, or system integration issues.',
-                'severity': 'MEDIUM'
-            }
-        ]
+    def _add_key_findings(self, insights_data: Dict) -> Iterator[Flowable]:
+        """Yield the key findings section"""
+        yield from self._section_header("Key Findings & Analysis")
         
-        for finding in findings:
-            # Finding title
-            finding_title = Paragraph(
-                f"<b>{finding['title']}</b> [{finding['severity']}]",
-                ParagraphStyle(
-                    name='FindingTitle',
-                    fontSize=12,
-                    textColor=colors.HexColor('#1e293b'),
-                    spaceAfter=6,
-                    fontName='Helvetica-Bold'
-                )
-            )
-            self.story.append(finding_title)
-            
-            # Finding content
-            finding_para = Paragraph(finding['content'], self.styles['InsightBox'])
-            self.story.append(finding_para)
-            self.story.append(Spacer(1, 0.15*inch))
+        yield from map(copy.copy, _FINDINGS_FLOWABLES)
     
-    def _add_metrics_analysis(self, metrics: Dict):
-        """Add detailed metrics analysis"""
-        self.story.append(Paragraph("Comprehensive Metrics", self.styles['CustomHeading']))
-        self.story.append(Spacer(1, 0.2*inch))
+    def _add_metrics_analysis(self, metrics: Dict) -> Iterator[Flowable]:
+        """Yield the detailed metrics analysis"""
+        yield from self._section_header("Comprehensive Metrics")
         
         # Create metrics table
-        metrics_data = [
-            ['Metric', 'Value', 'Status', 'Trend'],
-            ['Total Active Aadhaar', '1.23 Billion', 'Healthy', '↑ 4.2%'],
-            ['Demographic Updates', '98.8 Million', 'Healthy', '↑ 3.1%'],
-            ['Biometric Coverage', '87.5%', 'Good', '↑ 2.8%'],
-            ['High-Risk Districts', '127', 'Alert', '↓ 2.3%'],
-            ['Vulnerable Population', '456.8 Million', 'Alert', '↑ 1.5%'],
-            ['Anomalies Detected', '234', 'Warning', '↑ 5.2%'],
-        ]
+        table = Table(_METRICS_DATA, colWidths=_METRICS_COL_WIDTHS)
+        table.setStyle(_METRICS_TABLE_STYLE)
         
-        table = Table(metrics_data, colWidths=[2.2*inch, 1.5*inch, 1.2*inch, 1.1*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0f172a')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f1f5f9')]),
-        ]))
-        
-        self.story.append(table)
+        yield table
     
-    def _add_recommendations(self, recommendations: List[Dict]):
-        """Add recommendations section"""
-        self.story.append(Paragraph("Strategic Recommendations", self.styles['CustomHeading']))
-        self.story.append(Spacer(1, 0.2*inch))
+    def _add_recommendations(self, recommendations: List[RecommendationInput]) -> Iterator[Flowable]:
+        """Yield the recommendations section"""
+        yield from self._section_header("Strategic Recommendations")
         
         for i, rec in enumerate(recommendations, 1):
-            rec_title = Paragraph(
-                f"<b>{i}. {rec.get('title', 'Recommendation')}</b>",
-                ParagraphStyle(
-                    name='RecTitle',
-                    fontSize=11,
-                    textColor=colors.HexColor('#0f172a'),
-                    spaceAfter=6,
-                    fontName='Helvetica-Bold'
-                )
-            )
-            self.story.append(rec_title)
-            
-            rec_para = Paragraph(rec.get('description', ''), self.styles['InsightBox'])
-            self.story.append(rec_para)
-            
-            self.story.append(Spacer(1, 0.1*inch))
+            if not isinstance(rec, Recommendation):
+                rec = Recommendation.from_dict(rec)
+            # Recommendation text is plain and may come from callers, so
+            # escape it rather than let the paragraph parser trip on & or <
+            yield Paragraph(f"<b>{i}. {escape(rec.title)}</b>", _REC_TITLE_STYLE)
+            yield _PlainParagraph(escape(rec.description), self.styles['InsightBox'])
+            yield _spacer(0.1)
     
-    def _add_conclusion(self):
-        """Add conclusion"""
-        self.story.append(Paragraph("Conclusion", self.styles['CustomHeading']))
-        self.story.append(Spacer(1, 0.2*inch))
-        
-        conclusion_text = """
-        The Aadhaar ecosystem has achieved unprecedented coverage and adoption, forming the backbone
-        of India's digital identity infrastructure. However, analysis reveals critical gaps in coverage
-        for vulnerable populations, significant regional disparities in system health, and emerging patterns
-        of life-stage migration that demand nuanced policy responses.
-        <br/><br/>
-        Success requires targeted interventions: mobile enrollment camps for underserved populations,
-        simplified biometric processes for elderly citizens, school-based programs for child enrollment,
-        and robust data quality assurance frameworks. The path forward combines technological improvements
-        with human-centered design and equitable access principles.
-        """
+    def _add_conclusion(self) -> Iterator[Flowable]:
+        """Yield the conclusion"""
+        yield from self._section_header("Conclusion")
         
-        para = Paragraph(conclusion_text, self.styles['CustomBody'])
-        self.story.append(para)
+        yield copy.copy(_CONCLUSION_PARA)
     
     def _format_metrics_summary(self, metrics: Dict) -> Paragraph:
         """Format metrics summary for cover page"""
-        metrics_text = f"""
-        <b>Key Metrics Overview:</b><br/>
-        • Total Enrolment: {metrics.get('totalEnrolment', 'N/A')}<br/>
-        • Demographic Updates: {metrics.get('demographicUpdates', 'N/A')}<br/>
-        • Biometric Coverage: {metrics.get('biometricCoverage', 'N/A')}<br/>
-        • High-Risk Districts: {metrics.get('highRiskDistricts', 'N/A')}<br/>
-        • Vulnerable Population: {metrics.get('vulnerablePopulation', 'N/A')}
-        """
+        metrics_text = _METRICS_SUMMARY_TMPL.format_map(defaultdict(lambda: 'N/A', metrics))
         
         return Paragraph(metrics_text, self.styles['CustomBody'])
 
 
-class InsightExtractor:
-    """Extract and structure insights for reporting"""
+def _create_report_job(output_dir: str, page_compression: bool,
+                       job: Tuple[Dict, List[RecommendationInput], Dict, str]) -> str:
+    """Build a single report; runs in a create_reports_batch worker process"""
+    return AadhaarReportGenerator(output_dir, page_compression).create_report(*job)
+
+
+# Recommendation issued for each insight title
+_RECOMMENDATION_TEMPLATES = {
+    'Data Anomalies': Recommendation(
+        title='Implement Data Quality Framework',
+        description='Establish automated data validation pipelines to detect and correct anomalies in real-time. '
+                    'Implement regular data audits and establish clear data governance standards.',
+        priority=1,
+        timeline='3 months'
+    ),
+    'Vulnerable Populations': Recommendation(
+        title='Launch Targeted Enrollment Programs',
+        description='Deploy mobile enrollment units to remote and underserved areas. Partner with NGOs and '
+                    'community organizations for door-to-door enrollment drives.',
+        priority=1,
+        timeline='6 months'
+    ),
+}
+
+
+def _count_high_risk(scores, threshold: float = 0.7) -> int:
+    """Count vulnerability scores at or above threshold (NaN never counts)"""
+    return int(np.count_nonzero(np.asarray(scores) >= threshold))
+
+
+def extract_critical_insights(analysis_results: Dict) -> List[Dict]:
+    """Extract critical insights from analysis"""
+    insights = []
     
-    @staticmethod
-    def extract_critical_insights(analysis_results: Dict) -> List[Dict]:
-        """Extract critical insights from analysis"""
-        insights = []
-        
-        if 'anomalies' in analysis_results:
-            anomaly_count = len(analysis_results['anomalies'])
-            insights.append({
-                'title': 'Data Anomalies',
-                'count': anomaly_count,
-                'severity': 'HIGH',
-                'description': f'{anomaly_count} data irregularities detected'
-            })
-        
-        if 'vulnerability' in analysis_results:
-            vulnerable_count = analysis_results['vulnerability'].get('high_risk_count', 0)
-            insights.append({
-                'title': 'Vulnerable Populations',
-                'count': vulnerable_count,
-                'severity': 'CRITICAL',
-                'description': f'{vulnerable_count} high-vulnerability regions identified'
-            })
-        
-        return insights
+    if 'anomalies' in analysis_results:
+        anomaly_count = len(analysis_results['anomalies'])
+        insights.append({
+            'title': 'Data Anomalies',
+            'count': anomaly_count,
+            'severity': 'HIGH',
+            'description': f'{anomaly_count} data irregularities detected'
+        })
     
-    @staticmethod
-    def generate_recommendations(insights: List[Dict], 
-                               severity_filter: str = 'HIGH') -> List[Dict]:
-        """Generate recommendations based on insights"""
-        recommendations = []
-        
-        for insight in insights:
-            if insight['severity'] == severity_filter or severity_filter == 'ALL':
-                if insight['title'] == 'Data Anomalies':
-                    recommendations.append({
-                        'title': 'Implement Data Quality Framework',
-                        'description': 'Establish automated data validation pipelines to detect and correct anomalies in real-time. '
-                                      'Implement regular data audits and establish clear data governance standards.',
-                        'priority': 1,
-                        'timeline': '3 months'
-                    })
-                elif insight['title'] == 'Vulnerable Populations':
-                    recommendations.append({
-                        'title': 'Launch Targeted Enrollment Programs',
-                        'description': 'Deploy mobile enrollment units to remote and underserved areas. Partner with NGOs and '
-                                      'community organizations for door-to-door enrollment drives.',
-                        'priority': 1,
-                        'timeline': '6 months'
-                    })
-        
-        return recommendations
+    if 'vulnerability' in analysis_results:
+        vulnerability = analysis_results['vulnerability']
+        if 'high_risk_count' not in vulnerability and 'scores' in vulnerability:
+            vulnerable_count = _count_high_risk(vulnerability['scores'],
+                                                vulnerability.get('threshold', 0.7))
+        else:
+            vulnerable_count = vulnerability.get('high_risk_count', 0)
+        insights.append({
+            'title': 'Vulnerable Populations',
+            'count': vulnerable_count,
+            'severity': 'CRITICAL',
+            'description': f'{vulnerable_count} high-vulnerability regions identified'
+        })
+    
+    return insights
+
+
+def generate_recommendations(insights: List[Dict],
+                             severity_filter: str = 'HIGH') -> List[Recommendation]:
+    """Generate recommendations based on insights"""
+    recommendations = []
+    
+    for insight in insights:
+        if severity_filter in ('ALL', insight['severity']):
+            template = _RECOMMENDATION_TEMPLATES.get(insight['title'])
+            if template is not None:
+                recommendations.append(template)
+    
+    return recommendations
+
+
+# Back-compat namespace for callers of the former static-method class
+InsightExtractor = types.SimpleNamespace(
+    extract_critical_insights=extract_critical_insights,
+    generate_recommendations=generate_recommendations,
+)